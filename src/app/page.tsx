@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect, useRef } from "react";
+import { useState, useEffect, useRef, useMemo, memo } from "react";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Label } from "@/components/ui/label";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
@@ -17,6 +17,8 @@ import {
   Title,
   Tooltip,
   Legend,
+  Decimation,
+  type ChartOptions,
 } from 'chart.js';
 import { Line } from 'react-chartjs-2';
 
@@ -27,9 +29,32 @@ ChartJS.register(
   LineElement,
   Title,
   Tooltip,
-  Legend
+  Legend,
+  Decimation
 );
 
+const SAMPLING_RATE = 500;
+// Traces are generated at the full sampling rate and LTTB-downsampled to at
+// most MAX_CHART_POINTS before they reach the chart, preserving the QRS spikes.
+const SECONDS_PER_POINT = 1 / SAMPLING_RATE;
+const MAX_CHART_POINTS = 2000;
+const MAX_DURATION = 30;
+
+const arrhythmiaLabels: Record<string, string> = {
+    normal: 'קצב רגיל (Normal Sinus)',
+    afib: 'פרפור פרוזדורים (AFib)',
+    aflutter: 'רפרוף פרוזדורים (AFL)',
+    svt: 'SVT',
+    vt: 'VT (Ventricular Tachycardia)',
+    vfib: 'VF (Ventricular Fibrillation)',
+    av1: 'חסימה AV דרגה 1',
+    av2: 'חסימה AV דרגה 2',
+    av3: 'חסימה AV דרגה 3'
+};
+
+// Select options, built once rather than on every render.
+const arrhythmiaOptions = Object.entries(arrhythmiaLabels);
+
 const arrhythmiaDescriptions: Record<string, string> = {
     normal: 'קצב סינוס תקין - קצב לב רגיל ותקין עם גלי P, QRS ו-T תקינים.',
     afib: 'פרפור פרוזדורים - קצב לא סדיר ללא גלי P ברורים, תגובה חדרית לא סדירה.',
@@ -42,213 +67,350 @@ const arrhythmiaDescriptions: Record<string, string> = {
     av3: 'חסימה AV דרגה 3 - אין הולכה בין פרוזדורים לחדרים, קצב חדרי עצמאי.'
 };
 
-export default function ECGSimulator() {
-  const containerRef = useRef<HTMLDivElement>(null);
-  const [formData, setFormData] = useState({
-    type: "normal",
-    heartRate: 75,
-    duration: 10
-  });
-  
-  const [chartData, setChartData] = useState<{labels: string[], data: number[]}>({ labels: [], data: [] });
+// ----------------------------------------------------
+// ECG Generation Logic
+// ----------------------------------------------------
+// Shared waveform pieces. `normalized` is the position within the beat (0-1).
+const pWave = (normalized: number, amplitude = 0.2) =>
+  normalized > 0.1 && normalized < 0.2 ? amplitude * Math.sin((normalized - 0.1) * 10 * Math.PI) : 0;
+
+// Narrow QRS complex; `qrsPos` runs 0-1 across the complex.
+const qrsComplex = (qrsPos: number) => {
+  if (qrsPos < 0.3) return -0.3;
+  else if (qrsPos < 0.5) return 1.2;
+  else return -0.2;
+};
 
-  useEffect(() => {
-    const ctxAnim = gsap.context(() => {
-      gsap.from(".header-anim", { y: -30, opacity: 0, duration: 0.8, ease: "power3.out" });
-      gsap.from(".card-anim", { y: 30, opacity: 0, duration: 0.8, stagger: 0.2, ease: "power3.out", delay: 0.2 });
-    }, containerRef);
-    generateECG();
-    return () => ctxAnim.revert();
-  }, []);
+// P wave, QRS and T wave of a conducted sinus beat. `prDelay` shifts the QRS
+// and T wave later in the beat to lengthen the PR interval.
+const sinusBeat = (normalized: number, prDelay = 0) => {
+  const qrsStart = 0.3 + prDelay;
+  const tStart = 0.5 + prDelay;
+  if (normalized > 0.1 && normalized < 0.2) {
+      return pWave(normalized);
+  } else if (normalized > qrsStart && normalized < qrsStart + 0.1) {
+      return qrsComplex((normalized - qrsStart) * 10);
+  } else if (normalized > tStart && normalized < tStart + 0.2) {
+      return 0.3 * Math.sin((normalized - tStart) * 5 * Math.PI);
+  }
+  return 0;
+};
 
-  const handleChange = (field: string, value: string | number) => {
-    setFormData(prev => ({ ...prev, [field]: value }));
-  };
+const generateNormalECG = (i: number, interval: number) => sinusBeat((i % interval) / interval);
+
+const generateAFib = (i: number, interval: number) => {
+  const irregularInterval = interval * (0.7 + (Math.sin(i * 0.1) * 0.5 + 0.5) * 0.6); 
+  const position = i % irregularInterval;
+  const normalized = position / irregularInterval;
+  const baseline = Math.sin(i * 0.5) * 0.05;
+  if (normalized > 0.3 && normalized < 0.4) {
+      return baseline + qrsComplex((normalized - 0.3) * 10);
+  }
+  return baseline;
+};
 
-  // ----------------------------------------------------
-  // ECG Generation Logic
-  // ----------------------------------------------------
-  const generateNormalECG = (i: number, interval: number) => {
-    const position = i % interval;
-    const normalized = position / interval;
-    if (normalized > 0.1 && normalized < 0.2) {
-        return 0.2 * Math.sin((normalized - 0.1) * 10 * Math.PI);
-    } else if (normalized > 0.3 && normalized < 0.4) {
-        const qrsPos = (normalized - 0.3) * 10;
-        if (qrsPos < 0.3) return -0.3;
-        else if (qrsPos < 0.5) return 1.2;
-        else return -0.2;
-    } else if (normalized > 0.5 && normalized < 0.7) {
-        return 0.3 * Math.sin((normalized - 0.5) * 5 * Math.PI);
-    }
-    return 0;
-  };
+const generateAFlutter = (i: number, interval: number) => {
+  const fWaveFreq = 0.003;
+  const fWave = 0.15 * Math.sin(i * fWaveFreq * 2 * Math.PI);
+  const position = i % (interval * 2);
+  const normalized = position / (interval * 2);
+  if (normalized > 0.3 && normalized < 0.4) {
+      return fWave + qrsComplex((normalized - 0.3) * 10);
+  }
+  return fWave;
+};
 
-  const generateAFib = (i: number, interval: number) => {
-    const irregularInterval = interval * (0.7 + (Math.sin(i * 0.1) * 0.5 + 0.5) * 0.6); 
-    const position = i % irregularInterval;
-    const normalized = position / irregularInterval;
-    const baseline = Math.sin(i * 0.5) * 0.05;
-    if (normalized > 0.3 && normalized < 0.4) {
-        const qrsPos = (normalized - 0.3) * 10;
-        if (qrsPos < 0.3) return baseline - 0.3;
-        else if (qrsPos < 0.5) return baseline + 1.2;
-        else return baseline - 0.2;
-    }
-    return baseline;
-  };
+const generateSVT = generateNormalECG;
+
+const generateVT = (i: number, interval: number) => {
+  const position = i % interval;
+  const normalized = position / interval;
+  if (normalized > 0.2 && normalized < 0.5) {
+      const qrsPos = (normalized - 0.2) / 0.3;
+      if (qrsPos < 0.3) return -0.4;
+      else if (qrsPos < 0.6) return 1.0;
+      else return -0.3;
+  }
+  return 0;
+};
 
-  const generateAFlutter = (i: number, interval: number) => {
-    const fWaveFreq = 0.003;
-    const fWave = 0.15 * Math.sin(i * fWaveFreq * 2 * Math.PI);
-    const position = i % (interval * 2);
-    const normalized = position / (interval * 2);
-    if (normalized > 0.3 && normalized < 0.4) {
-        const qrsPos = (normalized - 0.3) * 10;
-        if (qrsPos < 0.3) return fWave - 0.3;
-        else if (qrsPos < 0.5) return fWave + 1.2;
-        else return fWave - 0.2;
-    }
-    return fWave;
-  };
+const generateVFib = (i: number) => {
+  return Math.sin(i * 0.05) * 0.4 * Math.sin(i * 0.2) + Math.sin(i * 0.1) * 0.3;
+};
 
-  const generateSVT = (i: number, interval: number) => generateNormalECG(i, interval);
+const generateAV1 = (i: number, interval: number) => sinusBeat((i % interval) / interval, 0.1);
 
-  const generateVT = (i: number, interval: number) => {
-    const position = i % interval;
-    const normalized = position / interval;
-    if (normalized > 0.2 && normalized < 0.5) {
-        const qrsPos = (normalized - 0.2) / 0.3;
-        if (qrsPos < 0.3) return -0.4;
-        else if (qrsPos < 0.6) return 1.0;
-        else return -0.3;
-    }
-    return 0;
-  };
+const generateAV2 = (i: number, interval: number) => {
+  const normalized = (i % interval) / interval;
+  // Every third P wave is not conducted.
+  if (Math.floor(i / interval) % 3 === 2) return pWave(normalized);
+  return sinusBeat(normalized);
+};
 
-  const generateVFib = (i: number) => {
-    return Math.sin(i * 0.05) * 0.4 * Math.sin(i * 0.2) + Math.sin(i * 0.1) * 0.3;
-  };
+const generateAV3 = (i: number, interval: number) => {
+  const atrialNorm = (i % interval) / interval;
+  const ventricularInterval = interval * 1.5;
+  const ventNorm = (i % ventricularInterval) / ventricularInterval;
+  let value = pWave(atrialNorm, 0.15);
+  if (ventNorm > 0.3 && ventNorm < 0.4) {
+      value += qrsComplex((ventNorm - 0.3) * 10);
+  }
+  return value;
+};
 
-  const generateAV1 = (i: number, interval: number) => {
-    const position = i % interval;
-    const normalized = position / interval;
-    if (normalized > 0.1 && normalized < 0.2) {
-        return 0.2 * Math.sin((normalized - 0.1) * 10 * Math.PI);
-    } else if (normalized > 0.4 && normalized < 0.5) {
-        const qrsPos = (normalized - 0.4) * 10;
-        if (qrsPos < 0.3) return -0.3;
-        else if (qrsPos < 0.5) return 1.2;
-        else return -0.2;
-    } else if (normalized > 0.6 && normalized < 0.8) {
-        return 0.3 * Math.sin((normalized - 0.6) * 5 * Math.PI);
-    }
-    return 0;
-  };
+type BeatGenerator = (i: number, interval: number) => number;
+
+// Waveform per arrhythmia type and the factor applied to its beat interval.
+const ECG_GENERATORS: Record<string, { generate: BeatGenerator; intervalScale: number }> = {
+  normal: { generate: generateNormalECG, intervalScale: 1 },
+  afib: { generate: generateAFib, intervalScale: 1 },
+  aflutter: { generate: generateAFlutter, intervalScale: 1 },
+  svt: { generate: generateSVT, intervalScale: 0.5 },
+  vt: { generate: generateVT, intervalScale: 0.6 },
+  vfib: { generate: generateVFib, intervalScale: 1 },
+  av1: { generate: generateAV1, intervalScale: 1 },
+  av2: { generate: generateAV2, intervalScale: 1 },
+  av3: { generate: generateAV3, intervalScale: 1 },
+};
+
+const generateECGData = (type: string, hr: number, duration: number) => {
+  const totalSamples = duration * SAMPLING_RATE;
+  // Resolve the generator once rather than switching on type per sample.
+  const { generate, intervalScale } = ECG_GENERATORS[type];
+  const beatInterval = (60 / hr) * SAMPLING_RATE * intervalScale;
 
-  const generateAV2 = (i: number, interval: number) => {
-    const beatNumber = Math.floor(i / interval);
-    if (beatNumber % 3 === 2) {
-        const position = i % interval;
-        const normalized = position / interval;
-        if (normalized > 0.1 && normalized < 0.2) {
-            return 0.2 * Math.sin((normalized - 0.1) * 10 * Math.PI);
-        }
-        return 0;
+  // Preallocated float32 buffer; the time axis is implied by the index.
+  const ecgData = new Float32Array(totalSamples);
+
+  for (let i = 0; i < totalSamples; i++) {
+      ecgData[i] = generate(i, beatInterval);
+  }
+  return ecgData;
+};
+
+// Generated traces keyed by (type, heart rate). Every sample depends only on
+// its index, so a shorter recording is a prefix of the longest one: each trace
+// is generated once at MAX_DURATION and shorter durations are views into it.
+// The views are kept too, so the same parameters always return the same array.
+// Eviction is least-recently-used: a hit moves the entry to the end of the Map.
+const MAX_CACHED_TRACES = 256;
+const traceCache = new Map<string, { samples: Float32Array; views: Map<number, Float32Array> }>();
+
+const getECGData = (type: string, hr: number, duration: number) => {
+  // Reject unknown types up front so they never get a cache entry of their own.
+  if (!Object.hasOwn(ECG_GENERATORS, type)) {
+    throw new Error(`Unknown arrhythmia type: ${type}`);
+  }
+  const key = `${type}:${hr}`;
+  let trace = traceCache.get(key);
+  if (trace) {
+    traceCache.delete(key);
+    traceCache.set(key, trace);
+  } else {
+    trace = { samples: generateECGData(type, hr, MAX_DURATION), views: new Map() };
+    if (traceCache.size >= MAX_CACHED_TRACES) {
+      traceCache.delete(traceCache.keys().next().value!);
     }
-    return generateNormalECG(i, interval);
-  };
+    traceCache.set(key, trace);
+  }
+  let view = trace.views.get(duration);
+  if (!view) {
+    view = trace.samples.subarray(0, duration * SAMPLING_RATE);
+    trace.views.set(duration, view);
+  }
+  return view;
+};
 
-  const generateAV3 = (i: number, interval: number) => {
-    const atrialInterval = interval;
-    const ventricularInterval = interval * 1.5;
-    let value = 0;
-    const atrialPos = i % atrialInterval;
-    const atrialNorm = atrialPos / atrialInterval;
-    if (atrialNorm > 0.1 && atrialNorm < 0.2) {
-        value += 0.15 * Math.sin((atrialNorm - 0.1) * 10 * Math.PI);
+// Largest-Triangle-Three-Buckets downsampling. Keeps the first and last
+// samples and, from each bucket in between, the sample forming the largest
+// triangle with the previously kept point and the next bucket's average.
+const lttb = (samples: Float32Array, threshold: number) => {
+  const n = samples.length;
+  if (n <= threshold) {
+    return Array.from(samples, (y, k) => ({ x: k * SECONDS_PER_POINT, y }));
+  }
+  const points = [{ x: 0, y: samples[0] }];
+  const bucketSize = (n - 2) / (threshold - 2);
+  let prev = 0;
+  for (let b = 0; b < threshold - 2; b++) {
+    const nextStart = Math.floor((b + 1) * bucketSize) + 1;
+    const nextEnd = Math.min(Math.floor((b + 2) * bucketSize) + 1, n);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += j;
+      avgY += samples[j];
     }
-    const ventPos = i % ventricularInterval;
-    const ventNorm = ventPos / ventricularInterval;
-    if (ventNorm > 0.3 && ventNorm < 0.4) {
-        const qrsPos = (ventNorm - 0.3) * 10;
-        if (qrsPos < 0.3) value += -0.3;
-        else if (qrsPos < 0.5) value += 1.2;
-        else value += -0.2;
+    avgX /= nextEnd - nextStart;
+    avgY /= nextEnd - nextStart;
+
+    const end = nextStart;
+    let chosen = Math.floor(b * bucketSize) + 1;
+    let maxArea = -1;
+    for (let j = chosen; j < end; j++) {
+      const area = Math.abs((prev - avgX) * (samples[j] - samples[prev]) - (prev - j) * (avgY - samples[prev]));
+      if (area > maxArea) {
+        maxArea = area;
+        chosen = j;
+      }
     }
-    return value;
+    points.push({ x: chosen * SECONDS_PER_POINT, y: samples[chosen] });
+    prev = chosen;
+  }
+  points.push({ x: (n - 1) * SECONDS_PER_POINT, y: samples[n - 1] });
+  return points;
+};
+
+// Downsampled chart points per trace view. Only the reduced points are kept,
+// and returning to parameters that were already plotted reuses them.
+const pointsCache = new WeakMap<Float32Array, { x: number; y: number }[]>();
+
+const getChartPoints = (samples: Float32Array) => {
+  let points = pointsCache.get(samples);
+  if (!points) {
+    points = lttb(samples, MAX_CHART_POINTS);
+    pointsCache.set(samples, points);
+  }
+  return points;
+};
+
+// Fill the cache for every arrhythmia type one at a time while the browser is
+// idle, so the first switch to another type does not have to generate it.
+// Returns a function that cancels the remaining work.
+const warmTraceCache = (hr: number) => {
+  const types = Object.keys(ECG_GENERATORS);
+  const hasIdleCallback = typeof window.requestIdleCallback === "function";
+  let handle = 0;
+  const next = () => {
+    const type = types.shift();
+    if (!type) return;
+    getECGData(type, hr, MAX_DURATION);
+    schedule();
   };
+  const schedule = () => {
+    handle = hasIdleCallback ? window.requestIdleCallback(next) : window.setTimeout(next, 0);
+  };
+  schedule();
+  return () => {
+    if (hasIdleCallback) window.cancelIdleCallback(handle);
+    else window.clearTimeout(handle);
+  };
+};
 
-  const generateECGData = (type: string, hr: number, duration: number) => {
-    const samplingRate = 500;
-    const totalSamples = duration * samplingRate;
-    const beatInterval = (60 / hr) * samplingRate;
-
-    const ecgData = [];
-    const labels = [];
-
-    for (let i = 0; i < totalSamples; i++) {
-        const time = i / samplingRate;
-        // Optimization: Subsample the data by 5 for ChartJS to render smoothly
-        if (i % 5 !== 0) continue; 
-        
-        labels.push(time.toFixed(2));
-
-        let value = 0;
-        switch (type) {
-            case 'normal': value = generateNormalECG(i, beatInterval); break;
-            case 'afib': value = generateAFib(i, beatInterval); break;
-            case 'aflutter': value = generateAFlutter(i, beatInterval); break;
-            case 'svt': value = generateSVT(i, beatInterval * 0.5); break;
-            case 'vt': value = generateVT(i, beatInterval * 0.6); break;
-            case 'vfib': value = generateVFib(i); break;
-            case 'av1': value = generateAV1(i, beatInterval); break;
-            case 'av2': value = generateAV2(i, beatInterval); break;
-            case 'av3': value = generateAV3(i, beatInterval); break;
-            default: value = generateNormalECG(i, beatInterval);
-        }
-        ecgData.push(value);
+// Static, so react-chartjs-2 sees the same options object on every render and
+// only updates the chart when the data itself changes.
+const chartOptions: ChartOptions<'line'> = {
+  responsive: true,
+  maintainAspectRatio: false,
+  animation: false,
+  normalized: true,
+  // The decimation plugin skips every dataset unless parsing is disabled at
+  // the chart level, not just on the dataset.
+  parsing: false,
+  plugins: {
+    legend: { display: false },
+    // LTTB-downsample to the canvas width once a trace has more than 1000
+    // points; the default threshold (4x the canvas width) is rarely reached.
+    decimation: { enabled: true, algorithm: 'lttb', threshold: 1000 },
+  },
+  scales: {
+    x: {
+      type: 'linear',
+      display: true,
+      title: { display: true, text: 'זמן (שניות)', color: '#cbd5e1' },
+      // Only the visible ticks are formatted, not every sample.
+      ticks: { color: '#94a3b8', maxTicksLimit: 20, callback: (value) => Number(value).toFixed(2) },
+      grid: { color: 'rgba(255, 255, 255, 0.1)' }
+    },
+    y: {
+      display: true,
+      title: { display: true, text: 'מתח (mV)', color: '#cbd5e1' },
+      ticks: { color: '#94a3b8' },
+      grid: { color: 'rgba(255, 255, 255, 0.1)' }
     }
-    return { labels, data: ecgData };
-  };
+  }
+};
 
-  const generateECG = () => {
-    const data = generateECGData(formData.type, formData.heartRate, formData.duration);
-    setChartData(data);
-  };
-  
-  // Chart Config
-  const dataOptions = {
-    labels: chartData.labels,
+// The chart and the info panel are memoized so that moving a slider only
+// re-renders the controls; the chart re-renders when a new trace is plotted
+// and the info panel when the arrhythmia type changes.
+const ECGChart = memo(function ECGChart({ samples }: { samples: Float32Array }) {
+  const points = getChartPoints(samples);
+
+  // Points are pre-parsed {x, y} pairs on a linear axis so the decimation
+  // plugin can LTTB-downsample them to the canvas width before drawing.
+  const dataOptions = useMemo(() => ({
     datasets: [{
       label: 'ECG',
-      data: chartData.data,
+      data: points,
       borderColor: '#ef4444',
       borderWidth: 2,
       pointRadius: 0,
       tension: 0,
     }]
-  };
+  }), [points]);
+
+  return (
+    <Card className="shadow-lg border border-border bg-card flex-grow">
+      <CardHeader>
+        <CardTitle className="text-xl flex items-center gap-2 text-foreground">
+          <Activity className="w-5 h-5 text-red-500" /> גרף ECG
+        </CardTitle>
+      </CardHeader>
+      <CardContent className="h-[500px] w-full bg-muted rounded-xl p-4 border border-border relative">
+        {samples.length > 0 ? (
+          <Line data={dataOptions} options={chartOptions} />
+        ) : (
+          <div className="absolute inset-0 flex items-center justify-center text-muted-foreground">
+            טוען נתונים...
+          </div>
+        )}
+      </CardContent>
+    </Card>
+  );
+});
+
+const ArrhythmiaInfo = memo(function ArrhythmiaInfo({ type }: { type: string }) {
+  return (
+    <div className="mt-4 p-5 bg-background rounded-xl border border-border">
+      <h3 className="text-md font-semibold text-foreground mb-2">מידע על ההפרעה</h3>
+      <p className="text-sm text-muted-foreground leading-relaxed">
+        {arrhythmiaDescriptions[type] || "בחר סוג הפרעת קצב לקבלת מידע"}
+      </p>
+    </div>
+  );
+});
+
+export default function ECGSimulator() {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [formData, setFormData] = useState({
+    type: "normal",
+    heartRate: 75,
+    duration: 10
+  });
   
-  const chartOptions = {
-    responsive: true,
-    maintainAspectRatio: false,
-    animation: { duration: 0 },
-    plugins: { legend: { display: false } },
-    scales: {
-      x: {
-        display: true,
-        title: { display: true, text: 'זמן (שניות)', color: '#cbd5e1' },
-        ticks: { color: '#94a3b8', maxTicksLimit: 20 },
-        grid: { color: 'rgba(255, 255, 255, 0.1)' }
-      },
-      y: {
-        display: true,
-        title: { display: true, text: 'מתח (mV)', color: '#cbd5e1' },
-        ticks: { color: '#94a3b8' },
-        grid: { color: 'rgba(255, 255, 255, 0.1)' }
-      }
-    }
+  const [chartData, setChartData] = useState<Float32Array>(() => new Float32Array(0));
+
+  useEffect(() => {
+    const ctxAnim = gsap.context(() => {
+      gsap.from(".header-anim", { y: -30, opacity: 0, duration: 0.8, ease: "power3.out" });
+      gsap.from(".card-anim", { y: 30, opacity: 0, duration: 0.8, stagger: 0.2, ease: "power3.out", delay: 0.2 });
+    }, containerRef);
+    generateECG();
+    const cancelWarmup = warmTraceCache(formData.heartRate);
+    return () => {
+      cancelWarmup();
+      ctxAnim.revert();
+    };
+  }, []);
+
+  const handleChange = (field: string, value: string | number) => {
+    setFormData(prev => ({ ...prev, [field]: value }));
+  };
+
+  const generateECG = () => {
+    const data = getECGData(formData.type, formData.heartRate, formData.duration);
+    setChartData(data);
   };
 
   return (
@@ -279,30 +441,16 @@ export default function ECGSimulator() {
               <Label className="flex items-center gap-2 text-foreground">
                 <Stethoscope className="w-4 h-4 text-red-500" /> סוג הפרעת קצב
               </Label>
-              <Select value={formData.type} onValueChange={(val) => handleChange("type", val || "")}>
+              <Select value={formData.type} onValueChange={(val) => { if (val) handleChange("type", val); }}>
                 <SelectTrigger className="bg-background border-border text-foreground focus:ring-red-500 justify-between text-right">
                   <span className="truncate">
-                    {formData.type === 'normal' ? 'קצב רגיל (Normal Sinus)' :
-                     formData.type === 'afib' ? 'פרפור פרוזדורים (AFib)' :
-                     formData.type === 'aflutter' ? 'רפרוף פרוזדורים (AFL)' :
-                     formData.type === 'svt' ? 'SVT' :
-                     formData.type === 'vt' ? 'VT (Ventricular Tachycardia)' :
-                     formData.type === 'vfib' ? 'VF (Ventricular Fibrillation)' :
-                     formData.type === 'av1' ? 'חסימה AV דרגה 1' :
-                     formData.type === 'av2' ? 'חסימה AV דרגה 2' :
-                     formData.type === 'av3' ? 'חסימה AV דרגה 3' : 'בחר'}
+                    {arrhythmiaLabels[formData.type] ?? 'בחר'}
                   </span>
                 </SelectTrigger>
                 <SelectContent className="bg-background border-border text-foreground" dir="rtl">
-                  <SelectItem value="normal">קצב רגיל (Normal Sinus)</SelectItem>
-                  <SelectItem value="afib">פרפור פרוזדורים (AFib)</SelectItem>
-                  <SelectItem value="aflutter">רפרוף פרוזדורים (AFL)</SelectItem>
-                  <SelectItem value="svt">SVT</SelectItem>
-                  <SelectItem value="vt">VT (Ventricular Tachycardia)</SelectItem>
-                  <SelectItem value="vfib">VF (Ventricular Fibrillation)</SelectItem>
-                  <SelectItem value="av1">חסימה AV דרגה 1</SelectItem>
-                  <SelectItem value="av2">חסימה AV דרגה 2</SelectItem>
-                  <SelectItem value="av3">חסימה AV דרגה 3</SelectItem>
+                  {arrhythmiaOptions.map(([value, label]) => (
+                    <SelectItem key={value} value={value}>{label}</SelectItem>
+                  ))}
                 </SelectContent>
               </Select>
             </div>
@@ -325,7 +473,7 @@ export default function ECGSimulator() {
                 <Clock className="w-4 h-4 text-red-500" /> משך (שניות): {formData.duration}
               </Label>
               <Slider 
-                min={5} max={30} step={1} 
+                min={5} max={MAX_DURATION} step={1} 
                 value={[formData.duration]} 
                 onValueChange={(vals: number | readonly number[]) => handleChange("duration", typeof vals === 'number' ? vals : vals[0])} 
                 className="my-4 [&_[role=slider]]:bg-red-500 [&_[data-orientation=horizontal]]:bg-red-500"
@@ -341,32 +489,12 @@ export default function ECGSimulator() {
               <span>הצג ECG</span>
             </Button>
 
-            <div className="mt-4 p-5 bg-background rounded-xl border border-border">
-              <h3 className="text-md font-semibold text-foreground mb-2">מידע על ההפרעה</h3>
-              <p className="text-sm text-muted-foreground leading-relaxed">
-                {arrhythmiaDescriptions[formData.type] || "בחר סוג הפרעת קצב לקבלת מידע"}
-              </p>
-            </div>
+            <ArrhythmiaInfo type={formData.type} />
           </aside>
 
           {/* Preview Panel */}
           <main className="lg:col-span-8 card-anim flex flex-col gap-6">
-            <Card className="shadow-lg border border-border bg-card flex-grow">
-              <CardHeader>
-                <CardTitle className="text-xl flex items-center gap-2 text-foreground">
-                  <Activity className="w-5 h-5 text-red-500" /> גרף ECG
-                </CardTitle>
-              </CardHeader>
-              <CardContent className="h-[500px] w-full bg-muted rounded-xl p-4 border border-border relative">
-                {chartData.labels.length > 0 ? (
-                  <Line data={dataOptions} options={chartOptions as any} />
-                ) : (
-                  <div className="absolute inset-0 flex items-center justify-center text-muted-foreground">
-                    טוען נתונים...
-                  </div>
-                )}
-              </CardContent>
-            </Card>
+            <ECGChart samples={chartData} />
           </main>
         </div>
 